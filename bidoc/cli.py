@@ -3,13 +3,13 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 import click
 from colorama import Fore, Style, init
 
 from bidoc.ai_summary import AISummary, get_summary_strategy
-from bidoc.config import load_config
+from bidoc.config import AppConfig, load_config
 from bidoc.constants import (
     DEFAULT_DOCS_FOLDER,
     JSON_FORMAT,
@@ -98,10 +98,6 @@ def main(
     setup_logging(logging.DEBUG if verbose else logging.INFO, log_file_path)
     logger = get_logger(__name__)
 
-    # Track processing results
-    successful_files = 0
-    failed_files = 0
-
     logger.info(f"{Fore.CYAN}Starting BI Documentation Tool{Style.RESET_ALL}")
     click.echo(f"{Fore.CYAN}Starting BI Documentation Tool{Style.RESET_ALL}")
     logger.info(f"Output directory: {output_path.absolute()}")
@@ -109,6 +105,48 @@ def main(
     if log_file_path:
         logger.info(f"Log file: {log_file_path.absolute()}")
 
+    successful_files, failed_files = run_pipeline(
+        input_files,
+        output_path,
+        output_format,
+        config,
+        verbose=verbose,
+        with_summary=with_summary,
+    )
+
+    # Summary
+    total_files = successful_files + failed_files
+    logger.info(f"\n{Fore.CYAN}Processing complete:{Style.RESET_ALL}")
+    click.echo(f"\n{Fore.CYAN}Processing complete:{Style.RESET_ALL}")
+    logger.info(f"  Total files: {total_files}")
+    logger.info(f"  {Fore.GREEN}Successful: {successful_files}{Style.RESET_ALL}")
+    if failed_files > 0:
+        logger.info(f"  {Fore.RED}Failed: {failed_files}{Style.RESET_ALL}")
+
+    # Exit with error code if any files failed
+    if failed_files > 0:
+        sys.exit(1)
+
+
+def run_pipeline(
+    input_files: Iterable[str],
+    output_path: Path,
+    output_format: str,
+    config: AppConfig,
+    *,
+    verbose: bool = False,
+    with_summary: bool = False,
+) -> Tuple[int, int]:
+    """Parse each input file and write its documentation
+
+    Returns the number of successful and failed files. Unlike ``main`` this
+    neither configures logging nor exits, so it can be called directly.
+    """
+    logger = get_logger(__name__)
+
+    successful_files = 0
+    failed_files = 0
+
     # Process each input file
     for input_file in input_files:
         input_path = Path(input_file)
@@ -150,18 +188,7 @@ def main(
                 logger.exception("Full error details:")
             failed_files += 1
 
-    # Summary
-    total_files = successful_files + failed_files
-    logger.info(f"\n{Fore.CYAN}Processing complete:{Style.RESET_ALL}")
-    click.echo(f"\n{Fore.CYAN}Processing complete:{Style.RESET_ALL}")
-    logger.info(f"  Total files: {total_files}")
-    logger.info(f"  {Fore.GREEN}Successful: {successful_files}{Style.RESET_ALL}")
-    if failed_files > 0:
-        logger.info(f"  {Fore.RED}Failed: {failed_files}{Style.RESET_ALL}")
-
-    # Exit with error code if any files failed
-    if failed_files > 0:
-        sys.exit(1)
+    return successful_files, failed_files
 
 
 def parse_file(file_path: Path, file_type: FileType) -> Optional[dict]:
@@ -200,22 +227,20 @@ def generate_outputs(
 
     if MARKDOWN_FORMAT in formats_to_generate:
         markdown_gen = MarkdownGenerator()
-        markdown_content = markdown_gen.generate(metadata)
         markdown_file = output_path / f"{base_name}.md"
         try:
             with open(markdown_file, "w", encoding="utf-8") as f:
-                f.write(markdown_content)
+                markdown_gen.generate_to(metadata, f)
             logger.info(f"  Generated Markdown: {markdown_file}")
         except OSError as e:
             logger.error(f"  Failed to write Markdown file: {e}")
 
     if JSON_FORMAT in formats_to_generate:
         json_gen = JSONGenerator()
-        json_content = json_gen.generate(metadata)
         json_file = output_path / f"{base_name}.json"
         try:
             with open(json_file, "w", encoding="utf-8") as f:
-                f.write(json_content)
+                json_gen.generate_to(metadata, f)
             logger.info(f"  Generated JSON: {json_file}")
         except OSError as e:
             logger.error(f"  Failed to write JSON file: {e}")
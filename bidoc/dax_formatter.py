@@ -14,9 +14,10 @@ DAX Formatter GitHub: https://github.com/sql-bi/DaxFormatter
 DAX Formatter Web: https://www.daxformatter.com/
 """
 
+import functools
 import re
 import signal
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class DAXFormatter:
@@ -306,6 +307,27 @@ class DAXFormatter:
         # Indentation settings
         self.indent_size = 4
 
+        # Compile the patterns used by every format() call once per formatter
+        self._whitespace_pattern = re.compile(r"\s+")
+        self._separator_pattern = re.compile(r"\s*([(),])\s*")
+        self._function_pattern = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\(")
+        self._keyword_pattern = re.compile(
+            r"\b(" + "|".join(re.escape(k) for k in sorted(self.keywords)) + r")\b",
+            flags=re.IGNORECASE,
+        )
+        self._operator_patterns = []
+        for op in self.operators:
+            if op in ["<>", "<=", ">="]:
+                # Multi-character operators
+                pattern = r"\s*" + re.escape(op) + r"\s*"
+            else:
+                # Single character operators
+                pattern = r"\s*\\" + re.escape(op) + r"\s*"
+            self._operator_patterns.append((re.compile(pattern), f" {op} "))
+        self._space_before_paren_pattern = re.compile(r"(?<![A-Z])\s+\(")
+        self._word_after_paren_pattern = re.compile(r"\)([a-zA-Z])")
+        self._comma_pattern = re.compile(r",\s*")
+
     def format(self, dax_expression: str) -> str:
         """
         Format a DAX expression for better readability.
@@ -336,12 +358,30 @@ class DAXFormatter:
 
         return expression.strip()
 
+    def format_batch(self, dax_expressions: List[str]) -> List[str]:
+        """
+        Format several DAX expressions in one call.
+
+        Duplicate expressions within the batch are only formatted once.
+
+        Args:
+            dax_expressions: The DAX expressions to format
+
+        Returns:
+            Formatted DAX expressions, in the same order as the input
+        """
+        formatted: Dict[str, str] = {}
+        for expression in dax_expressions:
+            if expression not in formatted:
+                formatted[expression] = self.format(expression)
+        return [formatted[expression] for expression in dax_expressions]
+
     def _normalize_whitespace(self, expression: str) -> str:
         """Normalize whitespace in the expression."""
         # Remove excessive whitespace
-        expression = re.sub(r"\s+", " ", expression)
+        expression = self._whitespace_pattern.sub(" ", expression)
         # Remove whitespace around specific characters
-        expression = re.sub(r"\s*([(),])\s*", r"\1", expression)
+        expression = self._separator_pattern.sub(r"\1", expression)
         return expression.strip()
 
     def _format_functions(self, expression: str) -> str:
@@ -354,8 +394,7 @@ class DAXFormatter:
             return match.group(0)
 
         # Match function names followed by opening parenthesis
-        pattern = r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\("
-        return re.sub(pattern, replace_function, expression)
+        return self._function_pattern.sub(replace_function, expression)
 
     def _format_keywords(self, expression: str) -> str:
         """Format DAX keywords to uppercase."""
@@ -367,45 +406,32 @@ class DAXFormatter:
             return match.group(0)
 
         # Match keywords as whole words
-        for keyword in self.keywords:
-            pattern = r"\b(" + re.escape(keyword) + r")\b"
-            expression = re.sub(
-                pattern, replace_keyword, expression, flags=re.IGNORECASE
-            )
-
-        return expression
+        return self._keyword_pattern.sub(replace_keyword, expression)
 
     def _format_operators(self, expression: str) -> str:
         """Add proper spacing around operators."""
         # Add spaces around operators (except inside table references)
-        for op in self.operators:
-            if op in ["<>", "<=", ">="]:
-                # Multi-character operators
-                pattern = r"\s*" + re.escape(op) + r"\s*"
-                expression = re.sub(pattern, f" {op} ", expression)
-            else:
-                # Single character operators
-                pattern = r"\s*\\" + re.escape(op) + r"\s*"
-                expression = re.sub(pattern, f" {op} ", expression)
+        for pattern, replacement in self._operator_patterns:
+            expression = pattern.sub(replacement, expression)
 
         # Clean up multiple spaces
-        expression = re.sub(r"\s+", " ", expression)
+        expression = self._whitespace_pattern.sub(" ", expression)
         return expression
 
     def _format_parentheses(self, expression: str) -> str:
         """Format parentheses with proper spacing."""
         # Remove spaces before opening parenthesis (except after keywords)
-        expression = re.sub(r"(?<![A-Z])\s+\(", "(", expression)
+        expression = self._space_before_paren_pattern.sub("(", expression)
 
         # Add space after closing parenthesis if followed by word
-        expression = re.sub(r"\)([a-zA-Z])", r") \1", expression)
+        expression = self._word_after_paren_pattern.sub(r") \1", expression)
 
         return expression
 
     def _format_commas(self, expression: str) -> str:
         """Format commas with proper spacing."""
         # Ensure space after comma
-        expression = re.sub(r",\s*", ", ", expression)
+        expression = self._comma_pattern.sub(", ", expression)
         return expression
 
     def _safe_regex_sub(self, pattern: str, repl: str, text: str) -> str:
@@ -478,18 +504,33 @@ class DAXFormatter:
         return f"{measure_name} = {formatted_expr}"
 
 
+# Shared formatter instance used by the module-level convenience functions
+_default_formatter: Optional[DAXFormatter] = None
+
+
+def get_default_formatter() -> DAXFormatter:
+    """Get or create the shared DAX formatter instance."""
+    global _default_formatter
+    if _default_formatter is None:
+        _default_formatter = DAXFormatter()
+    return _default_formatter
+
+
+@functools.lru_cache(maxsize=4096)
 def format_dax_expression(expression: str) -> str:
     """
     Convenience function to format a single DAX expression.
 
+    Formatting is pure string work, so results are memoized: expressions that
+    repeat across measures, columns and models are only formatted once.
+
     Args:
         expression: DAX expression to format
 
     Returns:
         Formatted DAX expression
     """
-    formatter = DAXFormatter()
-    return formatter.format(expression)
+    return get_default_formatter().format(expression)
 
 
 def format_dax_measure(name: str, expression: str) -> str:
@@ -503,8 +544,7 @@ def format_dax_measure(name: str, expression: str) -> str:
     Returns:
         Formatted measure definition
     """
-    formatter = DAXFormatter()
-    return formatter.format_measure(name, expression)
+    return get_default_formatter().format_measure(name, expression)
 
 
 # Attribution comment for documentation
@@ -2,8 +2,42 @@
 
 import json
 import logging
+import math
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, TextIO
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+def _normalize_for_json(value: Any) -> Any:
+    """Convert values the way orjson serializes them, for the json fallback
+
+    numpy scalars and arrays become plain numbers and lists, and NaN and
+    infinity become None (null), so both backends write the same document.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _normalize_for_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_for_json(item) for item in value]
+    if HAS_NUMPY and isinstance(value, (np.generic, np.ndarray)):
+        return _normalize_for_json(value.tolist())
+    return value
 
 
 class JSONGenerator:
@@ -13,9 +47,58 @@ class JSONGenerator:
         self.logger = logging.getLogger(__name__)
 
     def generate(self, metadata: Dict[str, Any]) -> str:
-        """Generate JSON documentation from metadata"""
+        """Generate JSON documentation from metadata
+
+        Uses orjson when it is installed, falling back to json.
+        """
+        self.logger.debug("Generating JSON documentation")
+        return self._dumps(self._prepare_output(metadata))
+
+    def _dumps(self, output_metadata: Dict[str, Any]) -> str:
+        """Serialize prepared metadata, preferring orjson over json
+
+        Both backends produce the same document: numpy values are written as
+        numbers and NaN or infinity as null.
+        """
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(
+                    output_metadata,
+                    default=self._json_serializer,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_SERIALIZE_NUMPY,
+                ).decode("utf-8")
+            except orjson.JSONEncodeError as e:
+                # e.g. integers outside the 64-bit range, which json handles
+                self.logger.debug(f"orjson encoding failed, using json: {str(e)}")
+
+        return json.dumps(_normalize_for_json(output_metadata), **self._dump_options())
+
+    def generate_to(self, metadata: Dict[str, Any], writer: TextIO) -> Dict[str, Any]:
+        """Generate JSON documentation and stream it to a text writer
+
+        Writes the same document as generate. Returns the metadata that was
+        serialized, so callers can inspect it without parsing the output back.
+        """
         self.logger.debug("Generating JSON documentation")
 
+        # json.dump emits the document chunk by chunk instead of building
+        # the full string in memory first, which orjson cannot do
+        output_metadata = self._prepare_output(metadata)
+        json.dump(_normalize_for_json(output_metadata), writer, **self._dump_options())
+        return output_metadata
+
+    def _dump_options(self) -> Dict[str, Any]:
+        """Keyword arguments shared by all JSON serialization calls"""
+        return {
+            "indent": 2,
+            "ensure_ascii": False,
+            "default": self._json_serializer,
+        }
+
+    def _prepare_output(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach generation info and clean the metadata for output"""
         # Add generation metadata
         output_metadata = {
             **metadata,
@@ -27,15 +110,7 @@ class JSONGenerator:
         }
 
         # Clean and format the metadata
-        cleaned_metadata = self._clean_metadata(output_metadata)
-
-        # Generate formatted JSON
-        return json.dumps(
-            cleaned_metadata,
-            indent=2,
-            ensure_ascii=False,
-            default=self._json_serializer,
-        )
+        return self._clean_metadata(output_metadata)
 
     def _clean_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Clean and standardize metadata for JSON output"""
@@ -198,6 +273,15 @@ class JSONGenerator:
 
     def validate_json(self, json_string: str) -> bool:
         """Validate that the generated JSON is valid"""
+        if HAS_ORJSON:
+            try:
+                orjson.loads(json_string)
+                return True
+            except orjson.JSONDecodeError:
+                # orjson rejects some documents json accepts, such as NaN
+                # or integers outside the 64-bit range, so let json decide
+                pass
+
         try:
             json.loads(json_string)
             return True
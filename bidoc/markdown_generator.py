@@ -1,7 +1,8 @@
 """Markdown documentation generator"""
 
 import logging
-from typing import Any, Dict
+import re
+from typing import Any, Dict, TextIO
 
 from bidoc.template_utils import (
     render_generic_template,
@@ -9,6 +10,12 @@ from bidoc.template_utils import (
     render_tableau_template,
 )
 
+# Patterns used by the markdownlint clean-up pass, compiled once
+_CODE_SPAN_LEADING_SPACE = re.compile(r"`\s+([^`]+)`")
+_CODE_SPAN_TRAILING_SPACE = re.compile(r"`([^`]+)\s+`")
+_CODE_SPAN_SURROUNDING_SPACE = re.compile(r"`\s+([^`]+)\s+`")
+_EXTRA_BLANK_LINES = re.compile(r"\n{3,}")
+
 
 class MarkdownGenerator:
     """Generate Markdown documentation from extracted metadata"""
@@ -33,6 +40,17 @@ class MarkdownGenerator:
         # Clean up markdown formatting issues
         return self._clean_markdown(content)
 
+    def generate_to(self, metadata: Dict[str, Any], writer: TextIO) -> str:
+        """Generate Markdown documentation and write it to a text writer
+
+        Returns the document that was written.
+        """
+        # The markdownlint clean-up pass needs the whole document (duplicate
+        # headings, blank line collapsing), so it is written in one chunk
+        content = self.generate(metadata)
+        writer.write(content)
+        return content
+
     def _generate_powerbi_markdown(self, metadata: Dict[str, Any]) -> str:
         """Generate Markdown for Power BI files"""
         return render_powerbi_template(metadata)
@@ -47,8 +65,6 @@ class MarkdownGenerator:
 
     def _clean_markdown(self, content: str) -> str:
         """Clean up markdown formatting issues to pass markdownlint"""
-        import re
-
         # First, split into lines for easier processing
         lines = content.split("\n")
 
@@ -61,12 +77,14 @@ class MarkdownGenerator:
         # Fix code span issues by removing extra spaces (MD038)
         # Handle multiple patterns: spaces at start, end, or both
         for i, original_line in enumerate(lines):
+            if "`" not in original_line:
+                continue
             # Remove spaces at the beginning of code spans
-            updated_line = re.sub(r"`\s+([^`]+)`", r"`\1`", original_line)
+            updated_line = _CODE_SPAN_LEADING_SPACE.sub(r"`\1`", original_line)
             # Remove spaces at the end of code spans
-            updated_line = re.sub(r"`([^`]+)\s+`", r"`\1`", updated_line)
+            updated_line = _CODE_SPAN_TRAILING_SPACE.sub(r"`\1`", updated_line)
             # Remove spaces at both ends
-            updated_line = re.sub(r"`\s+([^`]+)\s+`", r"`\1`", updated_line)
+            updated_line = _CODE_SPAN_SURROUNDING_SPACE.sub(r"`\1`", updated_line)
             lines[i] = updated_line
 
         # Handle long lines by wrapping at 80 characters where possible (MD013)
@@ -119,37 +137,41 @@ class MarkdownGenerator:
 
         # More aggressive blank line removal (MD012)
         # Remove any occurrence of 3+ consecutive newlines
-        content = re.sub(r"\n{3,}", "\n\n", content)
+        content = _EXTRA_BLANK_LINES.sub("\n\n", content)
 
         # Ensure fenced code blocks are surrounded by blank lines (MD031)
         # Split content to handle code blocks more carefully
-        parts = []
-        current_part = ""
+        # Collect chunks and join once; every chunk ends with a newline
+        chunks = []
         in_code_block = False
 
         for line in content.split("\n"):
             if line.strip().startswith("```"):
                 if not in_code_block:
                     # Starting a code block
-                    if current_part and not current_part.endswith("\n\n"):
-                        current_part = current_part.rstrip() + "\n\n"
-                    current_part += line + "\n"
+                    if chunks and not "".join(chunks[-2:]).endswith("\n\n"):
+                        while chunks and not chunks[-1].strip():
+                            chunks.pop()
+                        if chunks:
+                            chunks[-1] = chunks[-1].rstrip()
+                        chunks.append("\n\n")
+                    chunks.append(line + "\n")
                     in_code_block = True
                 else:
                     # Ending a code block
-                    current_part += line + "\n\n"
+                    chunks.append(line + "\n\n")
                     in_code_block = False
             elif in_code_block:
-                current_part += line + "\n"
+                chunks.append(line + "\n")
             elif line.strip() == "":
-                current_part += "\n"
+                chunks.append("\n")
             else:
-                current_part += line + "\n"
+                chunks.append(line + "\n")
 
-        content = current_part
+        content = "".join(chunks)
 
         # Clean up multiple blank lines again after code block processing
-        content = re.sub(r"\n{3,}", "\n\n", content)
+        content = _EXTRA_BLANK_LINES.sub("\n\n", content)
 
         # Remove blank lines at the very beginning
         content = content.lstrip("\n")
@@ -62,6 +62,11 @@ class OptimizedPowerBIParser(MetadataExtractor):
         self.streaming_processor = StreamingMetadataProcessor()
         self.large_file_handler = LargeFileHandler(size_threshold_mb=50.0)
         
+        # Cached-parse bookkeeping reported by cache_stats()
+        self._cache_requests = 0
+        self._cache_misses = 0
+        self._cache_bytes_saved = 0
+        
         self.logger.debug(f"Initialized OptimizedPowerBIParser (cache: {cache_enabled})")
 
     @performance_monitored
@@ -77,15 +82,32 @@ class OptimizedPowerBIParser(MetadataExtractor):
         
         # Use cached parsing for regular files
         if self.cache_enabled:
-            return self._parse_cached(file_path)
+            self._cache_requests += 1
+            misses = self._cache_misses
+            result = self._parse_cached(file_path)
+            if self._cache_misses == misses:
+                self._cache_bytes_saved += int(file_size_mb * 1024 * 1024)
+            return result
         else:
             return self._parse_internal(file_path)
 
     @hybrid_cached(memory_ttl=1800, file_max_age=3600)  # 30min memory, 1hr file cache
     def _parse_cached(self, file_path: Path) -> Dict[str, Any]:
         """Parse with caching enabled."""
+        self._cache_misses += 1
         return self._parse_internal(file_path)
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts for cached parses by this parser."""
+        hits = self._cache_requests - self._cache_misses
+        return {
+            'requests': self._cache_requests,
+            'hits': hits,
+            'misses': self._cache_misses,
+            'hit_rate': hits / self._cache_requests if self._cache_requests else 0.0,
+            'bytes_saved': self._cache_bytes_saved,
+        }
+
     @performance_monitored
     def _parse_internal(self, file_path: Path) -> Dict[str, Any]:
         """Internal parsing method with performance monitoring."""
@@ -431,7 +431,7 @@ class PowerBIParser(MetadataExtractor):
                             "name": str(table_name),
                             "expression": str(expression),
                             "expression_formatted": (
-                                self.dax_formatter.format(str(expression))
+                                format_dax_expression(str(expression))
                                 if expression
                                 else "not available"
                             ),
@@ -2,6 +2,7 @@
 
 import functools
 import logging
+import os
 try:
     import psutil
     HAS_PSUTIL = True
@@ -17,6 +18,24 @@ from collections import defaultdict
 
 F = TypeVar('F', bound=Callable[..., Any])
 
+_BYTES_PER_MB = 1 << 20
+
+# psutil handle for the current process, recreated after a fork
+_process: Optional["psutil.Process"] = None
+
+
+def _rss_mb() -> float:
+    """Get the resident memory of the current process in MB (0.0 without psutil)."""
+    global _process
+    if not HAS_PSUTIL:
+        return 0.0
+    try:
+        if _process is None or _process.pid != os.getpid():
+            _process = psutil.Process()
+        return _process.memory_info().rss / _BYTES_PER_MB
+    except Exception:
+        return 0.0
+
 
 @dataclass
 class PerformanceMetrics:
@@ -43,11 +62,7 @@ class PerformanceMonitor:
     
     def _get_memory_usage(self) -> float:
         """Get current memory usage in MB."""
-        try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
-        except Exception:  # Handle all exceptions when psutil might not be available
-            return 0.0
+        return _rss_mb()
     
     def _get_cpu_percent(self) -> float:
         """Get current CPU usage percentage."""
@@ -61,7 +76,7 @@ class PerformanceMonitor:
     @contextmanager
     def measure(self, operation_name: str) -> Generator[None, None, None]:
         """Context manager to measure performance of an operation."""
-        start_time = time.time()
+        start_counter = time.perf_counter()
         start_memory = self._get_memory_usage()
         peak_memory = start_memory
         
@@ -73,19 +88,19 @@ class PerformanceMonitor:
             peak_memory = max(peak_memory, current_memory)
             
         finally:
-            end_time = time.time()
+            execution_time = time.perf_counter() - start_counter
             end_memory = self._get_memory_usage()
             cpu_percent = self._get_cpu_percent()
             
             metric = PerformanceMetrics(
                 function_name=operation_name,
-                execution_time=end_time - start_time,
+                execution_time=execution_time,
                 memory_before=start_memory,
                 memory_after=end_memory,
                 memory_peak=peak_memory,
                 memory_delta=end_memory - start_memory,
                 cpu_percent=cpu_percent,
-                timestamp=start_time,
+                timestamp=time.time(),
                 args_count=0,
                 kwargs_count=0
             )
@@ -190,7 +205,7 @@ def performance_monitored(func: F) -> F:
     def wrapper(*args, **kwargs):
         monitor = get_performance_monitor()
         
-        start_time = time.time()
+        start_counter = time.perf_counter()
         start_memory = monitor._get_memory_usage()
         peak_memory = start_memory
         
@@ -204,13 +219,13 @@ def performance_monitored(func: F) -> F:
             return result
             
         finally:
-            end_time = time.time()
+            execution_time = time.perf_counter() - start_counter
             end_memory = monitor._get_memory_usage()
             cpu_percent = monitor._get_cpu_percent()
             
             monitor.record_function_call(
                 func_name=f"{func.__module__}.{func.__name__}",
-                execution_time=end_time - start_time,
+                execution_time=execution_time,
                 memory_before=start_memory,
                 memory_after=end_memory,
                 memory_peak=peak_memory,
@@ -242,11 +257,7 @@ class BatchProcessor:
     
     def _get_memory_usage(self) -> float:
         """Get current memory usage in MB."""
-        try:
-            process = psutil.Process()
-            return process.memory_info().rss / 1024 / 1024
-        except Exception:  # Handle all exceptions when psutil might not be available
-            return 0.0
+        return _rss_mb()
     
     def _should_force_batch(self) -> bool:
         """Check if memory usage requires batch processing."""
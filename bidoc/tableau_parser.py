@@ -76,14 +76,19 @@ class TableauParser(MetadataExtractor):
         }
 
         try:
-            # Handle .twbx and .tdsx files (extract .twb or .tds from zip)
-            if file_path.suffix.lower() in [".twbx", ".tdsx"]:
-                workbook_path = self._extract_workbook_from_archive(file_path)
-            else:
-                workbook_path = str(file_path)
+            with contextlib.ExitStack() as stack:
+                # Handle .twbx and .tdsx files (extract .twb or .tds from zip)
+                # into a temporary directory removed once the workbook is loaded
+                if file_path.suffix.lower() in [".twbx", ".tdsx"]:
+                    temp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+                    workbook_path = self._extract_workbook_from_archive(
+                        file_path, temp_dir
+                    )
+                else:
+                    workbook_path = str(file_path)
 
-            # Load workbook
-            workbook = Workbook(workbook_path)
+                # Load workbook
+                workbook = Workbook(workbook_path)
 
             # Extract all metadata sections
             metadata.update(
@@ -115,15 +120,13 @@ class TableauParser(MetadataExtractor):
             metadata = ensure_complete_metadata(metadata, "Tableau")
             return metadata
 
-    def _extract_workbook_from_archive(self, archive_path: Path) -> str:
-        """Extract .twb or .tds file from .twbx or .tdsx archive"""
+    def _extract_workbook_from_archive(self, archive_path: Path, temp_dir: str) -> str:
+        """Extract .twb or .tds file from .twbx or .tdsx archive into temp_dir"""
         self.log_extraction_progress(f"Extracting from {archive_path.suffix} archive")
 
         if not archive_path.exists():
             raise FileNotFoundError(f"Archive file not found at: {archive_path}")
 
-        temp_dir = tempfile.mkdtemp()
-
         file_extension_to_find = (
             ".twb" if archive_path.suffix.lower() == ".twbx" else ".tds"
         )
@@ -1,16 +1,17 @@
 """Template management utilities for external Jinja2 templates."""
 
+import io
 import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 try:
-    from jinja2 import Environment, FileSystemLoader, Template
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
     HAS_JINJA2 = True
 except ImportError:
-    Environment = FileSystemLoader = Template = None
+    Environment = FileSystemBytecodeCache = FileSystemLoader = Template = None
     HAS_JINJA2 = False
 
 
@@ -44,6 +45,7 @@ class TemplateManager:
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
+            bytecode_cache=get_bytecode_cache(),
         )
         
         self.logger.debug(f"Initialized template manager with directory: {template_dir}")
@@ -105,10 +107,28 @@ class TemplateManager:
 # Global template manager instance
 _template_manager: Optional[TemplateManager] = None
 
+# Compiled-template cache shared by all template managers
+_bytecode_cache: Optional["FileSystemBytecodeCache"] = None
 
-def _generate_basic_powerbi_markdown(metadata: Dict[str, Any]) -> str:
-    """Generate basic PowerBI markdown when templates are not available."""
-    content = f"""# Documentation for {metadata.get('file', 'Unknown File')}
+
+def get_bytecode_cache() -> Optional["FileSystemBytecodeCache"]:
+    """Get the on-disk Jinja2 bytecode cache, or None if it is unavailable.
+
+    Compiled templates are stored in Jinja2's per-user temp directory, so
+    only the first process to render a template pays for compiling it.
+    """
+    global _bytecode_cache
+    if _bytecode_cache is None and HAS_JINJA2:
+        try:
+            _bytecode_cache = FileSystemBytecodeCache()
+        except (OSError, RuntimeError) as e:
+            logging.getLogger(__name__).debug(f"Template bytecode cache disabled: {e}")
+    return _bytecode_cache
+
+
+def _write_basic_header(write: Callable[[str], Any], metadata: Dict[str, Any]) -> None:
+    """Write the title and overview shared by the basic markdown fallbacks."""
+    write(f"""# Documentation for {metadata.get('file', 'Unknown File')}
 
 Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
@@ -119,57 +139,57 @@ Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ## Data Sources
 
-"""
+""")
+
+
+def _generate_basic_powerbi_markdown(metadata: Dict[str, Any]) -> str:
+    """Generate basic PowerBI markdown when templates are not available."""
+    buf = io.StringIO()
+    write = buf.write
+    _write_basic_header(write, metadata)
+
     for ds in metadata.get('data_sources', []):
-        content += f"### {ds.get('name', 'Unknown')}\n\n"
-        content += f"- **Type:** {ds.get('type', 'Unknown')}\n"
-        content += f"- **Connection:** {ds.get('connection', 'Not specified')}\n\n"
+        write(f"### {ds.get('name', 'Unknown')}\n\n")
+        write(f"- **Type:** {ds.get('type', 'Unknown')}\n")
+        write(f"- **Connection:** {ds.get('connection', 'Not specified')}\n\n")
 
-    content += "## Tables and Fields\n\n"
+    write("## Tables and Fields\n\n")
     for table in metadata.get('tables', []):
-        content += f"### {table.get('name', 'Unknown')}\n\n"
+        write(f"### {table.get('name', 'Unknown')}\n\n")
         for col in table.get('columns', []):
-            content += f"- **{col.get('name', 'Unknown')}** ({col.get('data_type', 'Unknown')})\n"
-        content += "\n"
+            write(f"- **{col.get('name', 'Unknown')}** ({col.get('data_type', 'Unknown')})\n")
+        write("\n")
 
-    content += "## Measures\n\n"
+    write("## Measures\n\n")
     for measure in metadata.get('measures', []):
-        content += f"### {measure.get('name', 'Unknown')}\n\n"
-        content += f"```dax\n{measure.get('expression', 'No expression')}\n```\n\n"
+        write(f"### {measure.get('name', 'Unknown')}\n\n")
+        write(f"```dax\n{measure.get('expression', 'No expression')}\n```\n\n")
 
-    return content
+    return buf.getvalue()
 
 
 def _generate_basic_tableau_markdown(metadata: Dict[str, Any]) -> str:
     """Generate basic Tableau markdown when templates are not available."""
-    content = f"""# Documentation for {metadata.get('file', 'Unknown File')}
-
-Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Overview
-
-**File Type:** {metadata.get('type', 'Unknown')}
-**File Path:** `{metadata.get('file_path', 'Unknown')}`
-
-## Data Sources
+    buf = io.StringIO()
+    write = buf.write
+    _write_basic_header(write, metadata)
 
-"""
     for ds in metadata.get('data_sources', []):
-        content += f"### {ds.get('name', 'Unknown')}\n\n"
+        write(f"### {ds.get('name', 'Unknown')}\n\n")
         if 'connection' in ds:
-            content += f"- **Connection:** {ds['connection']}\n"
-        content += "\n"
+            write(f"- **Connection:** {ds['connection']}\n")
+        write("\n")
 
-    content += "## Worksheets\n\n"
+    write("## Worksheets\n\n")
     for ws in metadata.get('worksheets', []):
-        content += f"### {ws.get('name', 'Unknown')}\n\n"
+        write(f"### {ws.get('name', 'Unknown')}\n\n")
         if 'fields' in ws:
-            content += "**Fields:**\n"
+            write("**Fields:**\n")
             for field in ws['fields']:
-                content += f"- {field}\n"
-        content += "\n"
+                write(f"- {field}\n")
+        write("\n")
 
-    return content
+    return buf.getvalue()
 
 
 def get_template_manager() -> TemplateManager:
@@ -17,17 +17,17 @@ class FileType(Enum):
     UNKNOWN = "unknown"
 
 
-def detect_file_type(file_path: Path) -> FileType:
-    """Detect the type of BI file based on extension"""
-    suffix = file_path.suffix.lower()
+# Lower-cased file extension to file type
+FILE_TYPE_BY_SUFFIX = {
+    ".pbix": FileType.POWER_BI,
+    ".twb": FileType.TABLEAU_TWB,
+    ".twbx": FileType.TABLEAU_TWBX,
+}
 
-    file_type_mapping = {
-        ".pbix": FileType.POWER_BI,
-        ".twb": FileType.TABLEAU_TWB,
-        ".twbx": FileType.TABLEAU_TWBX,
-    }
 
-    return file_type_mapping.get(suffix, FileType.UNKNOWN)
+def detect_file_type(file_path: Path) -> FileType:
+    """Detect the type of BI file based on extension"""
+    return FILE_TYPE_BY_SUFFIX.get(file_path.suffix.lower(), FileType.UNKNOWN)
 
 
 def sanitize_filename(filename: str) -> str:
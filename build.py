@@ -141,9 +141,14 @@ class BuildManager:
         logger.info("🧪 Running test suite...")
         
         try:
-            # Try to run pytest
-            result = self.run_command("python -m pytest tests/ -v --tb=short", check=False)
-            if result.returncode == 0:
+            try:
+                import pytest
+            except ImportError:
+                returncode = self.run_command("python -m pytest tests/ -v --tb=short", check=False).returncode
+            else:
+                # Run in-process, reusing this interpreter and its imports
+                returncode = pytest.main([str(self.project_root / "tests"), "-v", "--tb=short"])
+            if returncode == 0:
                 logger.info("✅ All tests passed")
                 return True
             else:
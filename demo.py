@@ -16,31 +16,108 @@ using real PowerBI and Tableau sample files, showcasing:
 Run with: python demo.py
 """
 
-import json
+import atexit
 import logging
+import os
+import queue
+import re
 import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, NamedTuple, TextIO, Tuple
+
+class GeneratedFile(NamedTuple):
+    """A documentation file written during the demo"""
+    path: Path
+    size: int
+    kind: str  # 'md' or 'json'
+
+# Substrings counted in generated Markdown by analyze_generated_output
+MARKDOWN_MARKERS = (
+    "```dax",
+    "```m",
+    "### ",
+    "### Page:",
+    "| Field Name |",
+    "None",
+    "not available",
+)
+
+# Write buffer for generated documentation (1 MiB keeps multi-MB outputs
+# down to a handful of write() calls)
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Fenced DAX blocks that contain nothing but whitespace
+EMPTY_DAX_BLOCK = re.compile(r"```dax\s*\n\s*```")
 
 def setup_demo_logging():
-    """Setup enhanced logging for the demo"""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('demo_run.log')
-        ]
-    )
+    """Setup enhanced logging for the demo
+    
+    Log records are handed to a queue and written to the console and
+    demo_run.log by a background listener, so slow terminal or disk writes
+    never stall the processing loop.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.StreamHandler(), logging.FileHandler('demo_run.log')]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    
     return logging.getLogger(__name__)
 
-def analyze_output_quality(output_path: Path, file_type: str) -> Dict[str, Any]:
-    """Analyze the quality and completeness of generated documentation"""
+def scan_files(directory: Path, suffix: str = "") -> List[Tuple[Path, int]]:
+    """List files (and their sizes) in a directory with a single scandir pass"""
+    with os.scandir(directory) as entries:
+        return [
+            (Path(entry.path), entry.stat().st_size)
+            for entry in entries
+            if entry.is_file() and entry.name.endswith(suffix)
+        ]
+
+def open_output(path: Path) -> TextIO:
+    """Open a generated documentation file for writing
     
-    md_file = output_path / f"{output_path.stem}.md"
-    json_file = output_path / f"{output_path.stem}.json"
+    The text layer encodes to UTF-8 as text is written, into a large buffer,
+    so the JSON generator's streamed chunks and the Markdown generator's
+    single document reach disk in a handful of write() calls, without an
+    encoded copy of the whole document being built first.
+    """
+    return open(path, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE)
+
+def prefetch_file(path: Path) -> None:
+    """Ask the kernel to start reading a sample file ahead of parsing
     
-    analysis = {
+    Advice given on a private descriptor only affects that descriptor, and
+    the parsers open their own, so POSIX_FADV_WILLNEED is used: it starts
+    asynchronous readahead into the page cache that outlives the descriptor.
+    No-op on platforms without posix_fadvise.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+def count_markers(content: str) -> Dict[str, int]:
+    """Count occurrences of each Markdown marker in the content"""
+    return {marker: content.count(marker) for marker in MARKDOWN_MARKERS}
+
+def _empty_analysis() -> Dict[str, Any]:
+    """Create an empty output analysis record"""
+    return {
         "files_generated": [],
         "markdown_analysis": {},
         "json_analysis": {},
@@ -48,70 +125,119 @@ def analyze_output_quality(output_path: Path, file_type: str) -> Dict[str, Any]:
         "dax_formatting_quality": {},
         "issues_found": []
     }
+
+def _analyze_markdown(analysis: Dict[str, Any], md_content: str) -> None:
+    """Add Markdown metrics and issues to an analysis record"""
+    analysis["files_generated"].append("markdown")
+    
+    markers = count_markers(md_content)
+    analysis["markdown_analysis"] = {
+        "line_count": len(md_content.split('\n')),
+        "word_count": len(md_content.split()),
+        "has_dax_code_blocks": markers["```dax"] > 0,
+        "has_m_code_blocks": markers["```m"] > 0,
+        "measures_documented": markers["### "] - markers["### Page:"],
+        "tables_documented": markers["| Field Name |"],
+        "not_available_count": markers["not available"]
+    }
     
-    # Check if files were generated
-    if md_file.exists():
-        analysis["files_generated"].append("markdown")
+    # Check for common issues
+    if markers["None"]:
+        analysis["issues_found"].append("Found 'None' values instead of 'not available'")
+    if markers["```dax"] and EMPTY_DAX_BLOCK.search(md_content):
+        analysis["issues_found"].append("Found empty DAX code blocks")
+
+def _analyze_json(analysis: Dict[str, Any], json_data: Dict[str, Any], file_type: str) -> None:
+    """Add JSON metrics and metadata completeness to an analysis record"""
+    analysis["json_analysis"] = {
+        "total_sections": len(json_data.keys()),
+        "has_generation_info": "generation_info" in json_data,
+        "data_sources_count": len(json_data.get("data_sources", [])),
+        "tables_count": len(json_data.get("tables", [])),
+        "measures_count": len(json_data.get("measures", [])),
+        "relationships_count": len(json_data.get("relationships", []))
+    }
+    
+    # Check metadata completeness
+    if file_type == "Power BI":
+        expected_sections = [
+            "model_info", "data_sources", "tables", "relationships", 
+            "measures", "calculated_columns", "visualizations", "power_query"
+        ]
+    else:
+        expected_sections = [
+            "workbook_info", "data_sources", "worksheets", "dashboards", 
+            "parameters", "calculated_fields"
+        ]
+        
+    analysis["metadata_completeness"] = {
+        "expected_sections": len(expected_sections),
+        "present_sections": sum(1 for section in expected_sections if section in json_data),
+        "missing_sections": [section for section in expected_sections if section not in json_data]
+    }
+
+def analyze_generated_output(
+    md_content: str, json_data: Dict[str, Any], file_type: str
+) -> Dict[str, Any]:
+    """Analyze documentation that was just generated, without re-reading it"""
+    analysis = _empty_analysis()
+    _analyze_markdown(analysis, md_content)
+    analysis["files_generated"].append("json")
+    _analyze_json(analysis, json_data, file_type)
+    return analysis
+
+def process_sample_file(
+    logger, sample_file: Path, file_type: str, parser, md_gen, json_gen,
+    demo_output: Path, generated: List[GeneratedFile]
+):
+    """Parse one sample file, write its Markdown and JSON, and log a report"""
+    logger.info(f"\nProcessing: {sample_file.name}")
+    start_time = time.perf_counter()
+    
+    try:
+        # Parse the file
+        prefetch_file(sample_file)
+        metadata = parser.parse(sample_file)
         
-        # Analyze markdown content
-        md_content = md_file.read_text(encoding='utf-8')
-        analysis["markdown_analysis"] = {
-            "line_count": len(md_content.split('\n')),
-            "word_count": len(md_content.split()),
-            "has_dax_code_blocks": "```dax" in md_content,
-            "has_m_code_blocks": "```m" in md_content,
-            "measures_documented": md_content.count("### ") - md_content.count("### Page:"),
-            "tables_documented": md_content.count("| Field Name |"),
-            "not_available_count": md_content.count("not available")
-        }
+        # Generate outputs
+        base_name = sample_file.stem
         
-        # Check for common issues
-        if "None" in md_content:
-            analysis["issues_found"].append("Found 'None' values instead of 'not available'")
-        if "```dax\n\n```" in md_content:
-            analysis["issues_found"].append("Found empty DAX code blocks")
-            
-    if json_file.exists():
-        analysis["files_generated"].append("json")
+        # Generate Markdown
+        md_file = demo_output / f"{base_name}.md"
+        with open_output(md_file) as f:
+            markdown_content = md_gen.generate_to(metadata, f)
+            generated.append(GeneratedFile(md_file, f.tell(), 'md'))
         
-        # Analyze JSON content
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-                
-            analysis["json_analysis"] = {
-                "total_sections": len(json_data.keys()),
-                "has_generation_info": "generation_info" in json_data,
-                "data_sources_count": len(json_data.get("data_sources", [])),
-                "tables_count": len(json_data.get("tables", [])),
-                "measures_count": len(json_data.get("measures", [])),
-                "relationships_count": len(json_data.get("relationships", []))
-            }
-            
-            # Check metadata completeness
-            if file_type == "Power BI":
-                expected_sections = [
-                    "model_info", "data_sources", "tables", "relationships", 
-                    "measures", "calculated_columns", "visualizations", "power_query"
-                ]
-            else:
-                expected_sections = [
-                    "workbook_info", "data_sources", "worksheets", "dashboards", 
-                    "parameters", "calculated_fields"
-                ]
-                
-            analysis["metadata_completeness"] = {
-                "expected_sections": len(expected_sections),
-                "present_sections": sum(1 for section in expected_sections if section in json_data),
-                "missing_sections": [section for section in expected_sections if section not in json_data]
-            }
+        # Generate JSON
+        json_file = demo_output / f"{base_name}.json"
+        with open_output(json_file) as f:
+            json_data = json_gen.generate_to(metadata, f)
+            generated.append(GeneratedFile(json_file, f.tell(), 'json'))
+        
+        processing_time = time.perf_counter() - start_time
+        
+        # Analyze output quality from the documents just written
+        analysis = analyze_generated_output(markdown_content, json_data, file_type)
+        
+        logger.info(f"✅ Successfully processed in {processing_time:.2f}s")
+        logger.info(f"   Generated: {', '.join(analysis['files_generated'])}")
+        logger.info(f"   Markdown: {analysis['markdown_analysis'].get('line_count', 0)} lines")
+        logger.info(f"   JSON: {analysis['json_analysis'].get('total_sections', 0)} sections")
+        if file_type == "Power BI":
+            logger.info(f"   Measures documented: {analysis['markdown_analysis'].get('measures_documented', 0)}")
+            logger.info(f"   Tables documented: {analysis['markdown_analysis'].get('tables_documented', 0)}")
+        
+        if analysis['issues_found']:
+            logger.warning(f"   Issues found: {len(analysis['issues_found'])}")
+            for issue in analysis['issues_found']:
+                logger.warning(f"     - {issue}")
+        else:
+            logger.info("   ✅ No quality issues detected")
             
-        except json.JSONDecodeError as e:
-            analysis["issues_found"].append(f"Invalid JSON generated: {str(e)}")
-    
-    return analysis
+    except Exception as e:
+        logger.error(f"❌ Failed to process {sample_file.name}: {str(e)}")
 
-def demonstrate_powerbi_extraction(logger):
+def demonstrate_powerbi_extraction(logger, generated: List[GeneratedFile]):
     """Demonstrate PowerBI file extraction with real files"""
     logger.info("=" * 60)
     logger.info("DEMONSTRATION: PowerBI File Processing")
@@ -123,71 +249,39 @@ def demonstrate_powerbi_extraction(logger):
         logger.error(f"Samples directory not found: {samples_dir}")
         return
         
-    pbix_files = list(samples_dir.glob("*.pbix"))
+    pbix_files = scan_files(samples_dir, ".pbix")
     if not pbix_files:
         logger.error("No PowerBI sample files found")
         return
         
     logger.info(f"Found {len(pbix_files)} PowerBI sample files:")
-    for file in pbix_files:
-        logger.info(f"  - {file.name} ({file.stat().st_size / 1024:.1f} KB)")
+    for file, size in pbix_files:
+        logger.info(f"  - {file.name} ({size / 1024:.1f} KB)")
     
     # Process each file
     demo_output = Path("demo_output")
     demo_output.mkdir(exist_ok=True)
     
-    for pbix_file in pbix_files[:2]:  # Process first 2 files for demo
-        logger.info(f"\nProcessing: {pbix_file.name}")
-        start_time = time.time()
-        
-        try:
-            # Import and use the actual parser
-            from bidoc.pbix_parser import PowerBIParser
-            from bidoc.markdown_generator import MarkdownGenerator
-            from bidoc.json_generator import JSONGenerator
-            
-            # Parse the file
-            parser = PowerBIParser()
-            metadata = parser.parse(pbix_file)
-            
-            # Generate outputs
-            base_name = pbix_file.stem
-            
-            # Generate Markdown
-            md_gen = MarkdownGenerator()
-            markdown_content = md_gen.generate(metadata)
-            md_file = demo_output / f"{base_name}.md"
-            md_file.write_text(markdown_content, encoding='utf-8')
-            
-            # Generate JSON
-            json_gen = JSONGenerator()
-            json_content = json_gen.generate(metadata)
-            json_file = demo_output / f"{base_name}.json"
-            json_file.write_text(json_content, encoding='utf-8')
-            
-            processing_time = time.time() - start_time
-            
-            # Analyze output quality
-            analysis = analyze_output_quality(demo_output / base_name, "Power BI")
-            
-            logger.info(f"✅ Successfully processed in {processing_time:.2f}s")
-            logger.info(f"   Generated: {', '.join(analysis['files_generated'])}")
-            logger.info(f"   Markdown: {analysis['markdown_analysis'].get('line_count', 0)} lines")
-            logger.info(f"   JSON: {analysis['json_analysis'].get('total_sections', 0)} sections")
-            logger.info(f"   Measures documented: {analysis['markdown_analysis'].get('measures_documented', 0)}")
-            logger.info(f"   Tables documented: {analysis['markdown_analysis'].get('tables_documented', 0)}")
-            
-            if analysis['issues_found']:
-                logger.warning(f"   Issues found: {len(analysis['issues_found'])}")
-                for issue in analysis['issues_found']:
-                    logger.warning(f"     - {issue}")
-            else:
-                logger.info("   ✅ No quality issues detected")
-                
-        except Exception as e:
-            logger.error(f"❌ Failed to process {pbix_file.name}: {str(e)}")
+    # Import and build the parser and generators once for all files
+    from bidoc.pbix_parser import PowerBIParser
+    from bidoc.markdown_generator import MarkdownGenerator
+    from bidoc.json_generator import JSONGenerator
+    
+    try:
+        parser = PowerBIParser()
+    except ImportError as e:
+        logger.error(f"❌ PowerBI parser unavailable: {str(e)}")
+        return
+    md_gen = MarkdownGenerator()
+    json_gen = JSONGenerator()
+    
+    for pbix_file, _ in pbix_files[:2]:  # Process first 2 files for demo
+        process_sample_file(
+            logger, pbix_file, "Power BI", parser, md_gen, json_gen,
+            demo_output, generated
+        )
 
-def demonstrate_tableau_extraction(logger):
+def demonstrate_tableau_extraction(logger, generated: List[GeneratedFile]):
     """Demonstrate Tableau file extraction with real files"""
     logger.info("\n" + "=" * 60)
     logger.info("DEMONSTRATION: Tableau File Processing")
@@ -199,67 +293,37 @@ def demonstrate_tableau_extraction(logger):
         logger.warning(f"Tableau samples directory not found: {samples_dir}")
         return
         
-    twbx_files = list(samples_dir.glob("*.twbx"))
+    twbx_files = scan_files(samples_dir, ".twbx")
     if not twbx_files:
         logger.warning("No Tableau sample files found")
         return
         
     logger.info(f"Found {len(twbx_files)} Tableau sample files:")
-    for file in twbx_files:
-        logger.info(f"  - {file.name} ({file.stat().st_size / 1024:.1f} KB)")
+    for file, size in twbx_files:
+        logger.info(f"  - {file.name} ({size / 1024:.1f} KB)")
     
     # Process first file for demo
     demo_output = Path("demo_output")
     demo_output.mkdir(exist_ok=True)
     
-    for twbx_file in twbx_files[:1]:  # Process first file for demo
-        logger.info(f"\nProcessing: {twbx_file.name}")
-        start_time = time.time()
-        
-        try:
-            # Import and use the actual parser
-            from bidoc.tableau_parser import TableauParser
-            from bidoc.markdown_generator import MarkdownGenerator
-            from bidoc.json_generator import JSONGenerator
-            
-            # Parse the file
-            parser = TableauParser()
-            metadata = parser.parse(twbx_file)
-            
-            # Generate outputs
-            base_name = twbx_file.stem
-            
-            # Generate Markdown
-            md_gen = MarkdownGenerator()
-            markdown_content = md_gen.generate(metadata)
-            md_file = demo_output / f"{base_name}.md"
-            md_file.write_text(markdown_content, encoding='utf-8')
-            
-            # Generate JSON
-            json_gen = JSONGenerator()
-            json_content = json_gen.generate(metadata)
-            json_file = demo_output / f"{base_name}.json"
-            json_file.write_text(json_content, encoding='utf-8')
-            
-            processing_time = time.time() - start_time
-            
-            # Analyze output quality
-            analysis = analyze_output_quality(demo_output / base_name, "Tableau")
-            
-            logger.info(f"✅ Successfully processed in {processing_time:.2f}s")
-            logger.info(f"   Generated: {', '.join(analysis['files_generated'])}")
-            logger.info(f"   Markdown: {analysis['markdown_analysis'].get('line_count', 0)} lines")
-            logger.info(f"   JSON: {analysis['json_analysis'].get('total_sections', 0)} sections")
-            
-            if analysis['issues_found']:
-                logger.warning(f"   Issues found: {len(analysis['issues_found'])}")
-                for issue in analysis['issues_found']:
-                    logger.warning(f"     - {issue}")
-            else:
-                logger.info("   ✅ No quality issues detected")
-                
-        except Exception as e:
-            logger.error(f"❌ Failed to process {twbx_file.name}: {str(e)}")
+    # Import and build the parser and generators once for all files
+    from bidoc.tableau_parser import TableauParser
+    from bidoc.markdown_generator import MarkdownGenerator
+    from bidoc.json_generator import JSONGenerator
+    
+    try:
+        parser = TableauParser()
+    except ImportError as e:
+        logger.error(f"❌ Tableau parser unavailable: {str(e)}")
+        return
+    md_gen = MarkdownGenerator()
+    json_gen = JSONGenerator()
+    
+    for twbx_file, _ in twbx_files[:1]:  # Process first file for demo
+        process_sample_file(
+            logger, twbx_file, "Tableau", parser, md_gen, json_gen,
+            demo_output, generated
+        )
 
 def demonstrate_dax_formatting(logger):
     """Demonstrate DAX formatting capabilities"""
@@ -267,9 +331,9 @@ def demonstrate_dax_formatting(logger):
     logger.info("DEMONSTRATION: DAX Formatting Features")
     logger.info("=" * 60)
     
-    from bidoc.dax_formatter import DAXFormatter
-    
-    formatter = DAXFormatter()
+    # The shared formatter compiles its patterns once; format_batch also
+    # formats any repeated expression only once
+    from bidoc.dax_formatter import get_default_formatter
     
     # Sample DAX expressions to format
     sample_expressions = [
@@ -279,11 +343,12 @@ def demonstrate_dax_formatting(logger):
         "sumx(filter(sales,sales[product]='Widget'),sales[amount]*sales[quantity])"
     ]
     
-    for i, expression in enumerate(sample_expressions, 1):
+    formatted_all = get_default_formatter().format_batch(sample_expressions)
+    
+    for i, (expression, formatted) in enumerate(zip(sample_expressions, formatted_all), 1):
         logger.info(f"\nSample {i} - Original:")
         logger.info(f"  {expression}")
         
-        formatted = formatter.format(expression)
         logger.info(f"Sample {i} - Formatted:")
         logger.info(f"  {formatted}")
 
@@ -301,36 +366,33 @@ def demonstrate_cli_features(logger):
     logger.info("  bidoc -i file.pbix --log-file   # Save logs to file")
     logger.info("  bidoc -i file.pbix --with-summary # Include AI summary")
 
-def generate_demo_summary(logger):
+def generate_demo_summary(logger, generated: List[GeneratedFile]):
     """Generate a summary of the demo results"""
     logger.info("\n" + "=" * 60)
     logger.info("DEMO SUMMARY")
     logger.info("=" * 60)
     
-    demo_output = Path("demo_output")
-    if not demo_output.exists():
-        logger.warning("No demo output directory found")
+    if not generated:
+        logger.warning("No demo output files were generated")
         return
     
-    generated_files = list(demo_output.iterdir())
-    markdown_files = [f for f in generated_files if f.suffix == '.md']
-    json_files = [f for f in generated_files if f.suffix == '.json']
+    demo_output = Path("demo_output")
+    markdown_files = [(g.path, g.size) for g in generated if g.kind == 'md']
+    json_files = [(g.path, g.size) for g in generated if g.kind == 'json']
     
-    logger.info(f"Total files generated: {len(generated_files)}")
+    logger.info(f"Total files generated: {len(generated)}")
     logger.info(f"  Markdown files: {len(markdown_files)}")
     logger.info(f"  JSON files: {len(json_files)}")
     
     if markdown_files:
         logger.info("\nGenerated Markdown files:")
-        for md_file in markdown_files:
-            size_kb = md_file.stat().st_size / 1024
-            logger.info(f"  - {md_file.name} ({size_kb:.1f} KB)")
+        for md_file, size in markdown_files:
+            logger.info(f"  - {md_file.name} ({size / 1024:.1f} KB)")
     
     if json_files:
         logger.info("\nGenerated JSON files:")
-        for json_file in json_files:
-            size_kb = json_file.stat().st_size / 1024
-            logger.info(f"  - {json_file.name} ({size_kb:.1f} KB)")
+        for json_file, size in json_files:
+            logger.info(f"  - {json_file.name} ({size / 1024:.1f} KB)")
     
     logger.info(f"\nDemo output available in: {demo_output.absolute()}")
     logger.info("✅ Demo completed successfully!")
@@ -342,12 +404,15 @@ def main():
     logger.info("🚀 Starting BI Documentation Tool Comprehensive Demo")
     logger.info(f"Demo started at: {time.strftime('%Y-%m-%d %H:%M:%S')}")
     
+    # Files written by the extraction demos, for the final summary
+    generated: List[GeneratedFile] = []
+    
     try:
         # Demonstrate PowerBI extraction
-        demonstrate_powerbi_extraction(logger)
+        demonstrate_powerbi_extraction(logger, generated)
         
         # Demonstrate Tableau extraction
-        demonstrate_tableau_extraction(logger)
+        demonstrate_tableau_extraction(logger, generated)
         
         # Demonstrate DAX formatting
         demonstrate_dax_formatting(logger)
@@ -356,7 +421,7 @@ def main():
         demonstrate_cli_features(logger)
         
         # Generate summary
-        generate_demo_summary(logger)
+        generate_demo_summary(logger, generated)
         
     except Exception as e:
         logger.error(f"Demo failed: {str(e)}")
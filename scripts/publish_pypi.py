@@ -12,7 +12,9 @@ Usage:
 """
 
 import argparse
+import hashlib
 import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
@@ -20,6 +22,14 @@ import shutil
 import json
 import logging
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    HAS_REQUESTS = True
+except ImportError:
+    requests = None
+    HAS_REQUESTS = False
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,6 +37,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session for PyPI queries, created on first use
+_session = None
+
+def get_session():
+    """Get the shared pooled requests session"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return _session
+
 def setup_logging(verbose=False):
     """Setup logging configuration"""
     level = logging.DEBUG if verbose else logging.INFO
@@ -37,11 +58,12 @@ def setup_logging(verbose=False):
     )
 
 def run_command(command, check=True, capture_output=False):
-    """Run a shell command with error handling"""
-    logger.info(f"Running: {command}")
+    """Run a command (argv list or string) without a shell"""
+    if isinstance(command, str):
+        command = shlex.split(command)
+    logger.info(f"Running: {shlex.join(command)}")
     result = subprocess.run(
         command,
-        shell=True,
         check=check,
         capture_output=capture_output,
         text=True
@@ -50,6 +72,10 @@ def run_command(command, check=True, capture_output=False):
         return result.stdout.strip()
     return result
 
+def dist_files():
+    """List built distribution files, expanding what a shell would for dist/*"""
+    return sorted(str(path) for path in Path("dist").iterdir())
+
 def validate_environment():
     """Validate the publishing environment"""
     logger.info("Validating environment...")
@@ -63,8 +89,8 @@ def validate_environment():
     required_tools = ["python", "pip", "twine"]
     for tool in required_tools:
         try:
-            run_command(f"{tool} --version", capture_output=True)
-        except subprocess.CalledProcessError:
+            run_command([tool, "--version"], capture_output=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
             logger.error(f"Required tool not found: {tool}")
             sys.exit(1)
     
@@ -74,14 +100,13 @@ def clean_build_artifacts():
     """Clean up build artifacts from previous runs"""
     logger.info("Cleaning build artifacts...")
     
-    artifacts = ["build/", "dist/", "*.egg-info/"]
-    for pattern in artifacts:
-        for path in Path(".").glob(pattern):
+    artifacts = [Path("build"), Path("dist"), *Path(".").glob("*.egg-info")]
+    for path in artifacts:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
             if path.exists():
-                if path.is_dir():
-                    shutil.rmtree(path)
-                else:
-                    path.unlink()
+                logger.warning(f"Could not fully remove: {path}")
+            else:
                 logger.info(f"Removed: {path}")
     
     logger.info("✅ Build artifacts cleaned")
@@ -91,8 +116,14 @@ def run_tests():
     logger.info("Running test suite...")
     
     try:
-        result = run_command("python -m pytest tests/ -v --tb=short", check=False)
-        if result.returncode != 0:
+        try:
+            import pytest
+        except ImportError:
+            returncode = run_command(["python", "-m", "pytest", "tests/", "-v", "--tb=short"], check=False).returncode
+        else:
+            # Run in-process to avoid paying interpreter startup again
+            returncode = pytest.main(["tests/", "-v", "--tb=short"])
+        if returncode != 0:
             logger.warning("Some tests failed, but continuing with publish")
         else:
             logger.info("✅ All tests passed")
@@ -105,7 +136,7 @@ def validate_package():
     
     # Check setup.py syntax
     try:
-        run_command("python setup.py check", capture_output=True)
+        run_command(["python", "setup.py", "check"], capture_output=True)
         logger.info("✅ setup.py syntax is valid")
     except subprocess.CalledProcessError as e:
         logger.error(f"setup.py validation failed: {e}")
@@ -132,22 +163,41 @@ def build_package():
     logger.info("Building distribution packages...")
     
     # Build source and wheel distributions
-    run_command("python setup.py sdist bdist_wheel")
+    run_command(["python", "setup.py", "sdist", "bdist_wheel"])
     
     # Validate the built packages
     try:
-        run_command("twine check dist/*")
+        run_command(["twine", "check", *dist_files()])
         logger.info("✅ Package build completed and validated")
     except subprocess.CalledProcessError as e:
         logger.error(f"Package validation failed: {e}")
         sys.exit(1)
 
+def file_sha256(path):
+    """Compute the SHA-256 hex digest of a file"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def upload_distributions(repository_args=()):
+    """Log the dist files' checksums, then upload them with twine"""
+    files = dist_files()
+    
+    # Record exactly which artifacts are about to be published
+    logger.info("Distribution checksums:")
+    for path in files:
+        logger.info(f"  {Path(path).name}: sha256={file_sha256(path)}")
+    
+    run_command(["twine", "upload", *repository_args, *files])
+
 def publish_to_test_pypi():
     """Publish to TestPyPI for testing"""
     logger.info("Publishing to TestPyPI...")
     
     try:
-        run_command("twine upload --repository testpypi dist/*")
+        upload_distributions(["--repository", "testpypi"])
         logger.info("✅ Successfully published to TestPyPI")
         logger.info("Test installation with:")
         logger.info("pip install --index-url https://test.pypi.org/simple/ bidoc")
@@ -166,7 +216,7 @@ def publish_to_pypi():
         sys.exit(0)
     
     try:
-        run_command("twine upload dist/*")
+        upload_distributions()
         logger.info("✅ Successfully published to PyPI")
         logger.info("Installation command:")
         logger.info("pip install bidoc")
@@ -180,15 +230,18 @@ def get_package_info():
     
     # Get version from setup.py
     try:
-        version_output = run_command("python setup.py --version", capture_output=True)
+        version_output = run_command(["python", "setup.py", "--version"], capture_output=True)
         logger.info(f"  Version: {version_output}")
     except Exception:
         logger.info("  Version: Could not determine")
     
     # Check if version exists on PyPI
+    if not HAS_REQUESTS:
+        logger.info("  Latest on PyPI: Could not check (requests not installed)")
+        return
+    
     try:
-        import requests
-        response = requests.get("https://pypi.org/pypi/bidoc/json", timeout=10)
+        response = get_session().get("https://pypi.org/pypi/bidoc/json", timeout=10)
         if response.status_code == 200:
             data = response.json()
             latest_version = data["info"]["version"]
@@ -1,27 +1,51 @@
 #!/usr/bin/env python3
 """Development environment setup script for BI Documentation Tool"""
 
+import hashlib
 import os
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 
-def run_command(command, description="", check=True):
-    """Run a shell command with error handling"""
+# Virtual environment paths, resolved once for this platform
+IS_WINDOWS = os.name == "nt"
+VENV_DIR = Path(".venv")
+VENV_PYTHON = str(VENV_DIR / ("Scripts/python.exe" if IS_WINDOWS else "bin/python"))
+VENV_PIP = str(VENV_DIR / ("Scripts/pip.exe" if IS_WINDOWS else "bin/pip"))
+ACTIVATE_COMMAND = (
+    str(VENV_DIR / "Scripts" / "activate.bat") if IS_WINDOWS else f"source {VENV_DIR / 'bin' / 'activate'}"
+)
+LOCK_FILE = Path("requirements.lock")
+
+
+def run_command(argv, description="", check=True, stream=False):
+    """Run a command from an argv list, echoing its output as it arrives
+    
+    With stream=True the child writes straight to this terminal instead of
+    through a pipe, which suits long, chatty steps such as pip installs.
+    """
     print(f"📦 {description}...")
     try:
-        result = subprocess.run(
-            command, shell=True, check=check, capture_output=True, text=True
-        )
-        if result.stdout:
-            print(f"✅ {result.stdout.strip()}")
-        return True
-    except subprocess.CalledProcessError as e:
+        if stream:
+            proc = subprocess.run(argv, stdout=None, stderr=None)
+        else:
+            proc = subprocess.Popen(
+                argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+            )
+            with proc:
+                for line in proc.stdout:
+                    print(f"   {line.rstrip()}")
+    except OSError as e:
         print(f"❌ Error: {e}")
-        if e.stderr:
-            print(f"   {e.stderr.strip()}")
         return False
+    
+    if check and proc.returncode != 0:
+        print(f"❌ Error: {argv[0]} exited with status {proc.returncode}")
+        return False
+    return True
 
 
 def check_python_version():
@@ -38,59 +62,181 @@ def check_python_version():
 
 def setup_virtual_environment():
     """Setup Python virtual environment"""
-    venv_path = Path(".venv")
-    
-    if venv_path.exists():
+    if VENV_DIR.exists():
         print("✅ Virtual environment already exists")
         return True
     
     print("📦 Creating virtual environment...")
-    return run_command(f"{sys.executable} -m venv .venv", "Creating virtual environment")
+    return run_command([sys.executable, "-m", "venv", str(VENV_DIR)], "Creating virtual environment")
 
 
 def install_dependencies():
-    """Install project dependencies"""
-    pip_cmd = ".venv/bin/pip" if os.name != "nt" else ".venv\\Scripts\\pip.exe"
-    
-    commands = [
-        f"{pip_cmd} install --upgrade pip setuptools wheel",
-        f"{pip_cmd} install -r requirements.txt",
-        f"{pip_cmd} install -r requirements-dev.txt",
-        f"{pip_cmd} install -e .",
-    ]
+    """Install project dependencies
     
-    for cmd in commands:
-        if not run_command(cmd, f"Running: {cmd.split()[-1]}"):
-            return False
+    Downloads and built wheels are cached in PIP_CACHE_DIR, or .pip-cache/
+    by default. CI jobs can persist that directory between runs, keyed on
+    hashFiles('requirements*.txt'), so that later runs skip re-downloading.
     
-    return True
+    When uv is on PATH (``pipx install uv``) it performs the project install
+    instead of pip, which cuts setup time considerably.
+    """
+    cache_dir = Path(os.environ.get("PIP_CACHE_DIR", ".pip-cache")).resolve()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_args = ["--cache-dir", str(cache_dir)]
+    
+    # pip itself must be upgraded before it resolves anything else
+    if not run_command(
+        [VENV_PIP, "install", *cache_args, "--upgrade", "pip", "setuptools", "wheel"],
+        "Upgrading pip, setuptools and wheel",
+        stream=True,
+    ):
+        return False
+    
+    uv_exe = shutil.which("uv")
+    
+    if LOCK_FILE.exists():
+        # The lock is fully resolved and hash-pinned, so the resolver has nothing to do
+        installer = (
+            [uv_exe, "pip", "install", "--python", VENV_PYTHON] if uv_exe else [VENV_PIP, "install", *cache_args]
+        )
+        return run_command(
+            [*installer, "--require-hashes", "-r", str(LOCK_FILE)],
+            f"Installing locked dependencies from {LOCK_FILE}",
+            stream=True,
+        ) and run_command(
+            [*installer, "--no-deps", "-e", "."],
+            "Installing bidoc in editable mode",
+            stream=True,
+        )
+    
+    requirements_args = ["-r", "requirements.txt", "-r", "requirements-dev.txt", "-e", "."]
+    
+    if uv_exe:
+        return run_command(
+            [uv_exe, "pip", "install", "--python", VENV_PYTHON, *requirements_args],
+            "Installing project and development dependencies with uv",
+            stream=True,
+        )
+    
+    # Resolve and download all project requirements in a single pip run
+    return run_command(
+        [
+            VENV_PIP, "install", *cache_args, "--prefer-binary", *requirements_args,
+        ],
+        "Installing project and development dependencies",
+        stream=True,
+    )
+
+
+def refresh_lock():
+    """Regenerate the hash-locked requirements file
+    
+    Run ``python scripts/setup_dev.py --refresh-lock`` after changing
+    requirements*.txt. Uses uv when available, otherwise pip-tools.
+    """
+    sources = ["requirements.txt", "requirements-dev.txt"]
+    uv_exe = shutil.which("uv")
+    if uv_exe:
+        argv = [uv_exe, "pip", "compile", *sources, "--generate-hashes", "-o", str(LOCK_FILE)]
+    else:
+        argv = [VENV_PYTHON, "-m", "piptools", "compile", *sources, "--generate-hashes", "-o", str(LOCK_FILE)]
+    return run_command(argv, f"Compiling {LOCK_FILE}", stream=True)
 
 
 def setup_pre_commit():
     """Setup pre-commit hooks"""
     if not Path(".pre-commit-config.yaml").exists():
-        print("⚠️  No pre-commit config found, skipping pre-commit setup")
-        return True
+        return True, "No pre-commit config found, skipped pre-commit setup"
+    
+    ok = run_command([VENV_PYTHON, "-m", "pre_commit", "install"], "Setting up pre-commit hooks")
+    return ok, "" if ok else "pre-commit install failed"
+
+
+def verify_bidoc_import():
+    """Check that the bidoc package imports"""
+    ok = run_command(
+        [VENV_PYTHON, "-c", "import bidoc; print('✅ bidoc module imports successfully')"],
+        "Testing bidoc import",
+    )
+    return ok, "" if ok else "bidoc module failed to import"
+
+
+def run_pytest():
+    """Run the test suite"""
+    ok = run_command(
+        [VENV_PYTHON, "-m", "pytest", "tests/", "-n", "auto", "--dist=loadfile", "-q", "--tb=short"],
+        "Running test suite",
+        stream=True,
+    )
+    return ok, "" if ok else "test suite failed"
+
+
+def verify_cli():
+    """Check that the CLI starts"""
+    ok = run_command([VENV_PYTHON, "-m", "bidoc", "--help"], "Testing CLI functionality")
+    return ok, "" if ok else "bidoc --help failed"
+
+
+# Files whose content decides whether a post-install step must re-run
+DEPENDENCY_FILES = ["requirements.txt", "requirements-dev.txt", "pyproject.toml", "setup.py"]
+# The bidoc sources plus the package data shipped with them
+PACKAGE_FILES = ["bidoc/**/*.py", "bidoc/templates/*.j2", "bidoc/*.toml"]
+STEP_INPUTS = {
+    setup_pre_commit: [".pre-commit-config.yaml"],
+    verify_bidoc_import: DEPENDENCY_FILES + PACKAGE_FILES,
+    run_pytest: DEPENDENCY_FILES + PACKAGE_FILES + ["tests/**/*.py", "samples/**/*"],
+    verify_cli: DEPENDENCY_FILES + PACKAGE_FILES,
+}
+STAMP_DIR = VENV_DIR / ".stamps"
+
+
+def _digest(patterns):
+    """Hash the names and contents of the files matching patterns"""
+    digest = hashlib.blake2b(digest_size=16)
+    for pattern in patterns:
+        for path in sorted(Path(".").glob(pattern)):
+            if path.is_file():
+                digest.update(str(path).encode())
+                digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def run_stamped(step):
+    """Run a post-install step unless its inputs match the last successful run"""
+    stamp = STAMP_DIR / f"{step.__name__}.txt"
+    digest = _digest(STEP_INPUTS[step])
+    if stamp.exists() and stamp.read_text() == digest:
+        print(f"⏭️  {step.__doc__}: inputs unchanged, skipping")
+        return True, ""
     
-    activate_cmd = "source .venv/bin/activate" if os.name != "nt" else ".venv\\Scripts\\activate.bat"
-    return run_command(f"{activate_cmd} && pre-commit install", "Setting up pre-commit hooks")
+    ok, feedback = step()
+    if ok:
+        STAMP_DIR.mkdir(parents=True, exist_ok=True)
+        stamp.write_text(digest)
+    return ok, feedback
 
 
-def verify_installation():
-    """Verify the installation works"""
-    python_cmd = ".venv/bin/python" if os.name != "nt" else ".venv\\Scripts\\python.exe"
+def run_post_install_steps():
+    """Run the independent post-install steps concurrently
     
-    tests = [
-        (f"{python_cmd} -c 'import bidoc; print(\"✅ bidoc module imports successfully\")'", "Testing bidoc import"),
-        (f"{python_cmd} -m pytest tests/ -v --tb=short", "Running test suite"),
-        (f"{python_cmd} -m bidoc --help", "Testing CLI functionality"),
-    ]
+    Returns the list of (step, feedback) failures. A pre-commit failure is
+    fatal to the setup, verification failures are only reported. Steps whose
+    inputs are unchanged since their last success are skipped.
+    """
+    steps = [setup_pre_commit, verify_bidoc_import, run_pytest, verify_cli]
     
-    for cmd, desc in tests:
-        if not run_command(cmd, desc, check=False):
-            print(f"⚠️  {desc} failed, but continuing...")
+    failures = []
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = {executor.submit(run_stamped, step): step for step in steps}
+        for future in as_completed(futures):
+            step = futures[future]
+            ok, feedback = future.result()
+            if not ok:
+                failures.append((step, feedback))
+            elif feedback:
+                print(f"⚠️  {feedback}")
     
-    return True
+    return failures
 
 
 def main():
@@ -102,12 +248,14 @@ def main():
     project_root = script_dir.parent
     os.chdir(project_root)
     
+    if "--refresh-lock" in sys.argv[1:]:
+        return 0 if refresh_lock() else 1
+    
+    # These steps form a dependency chain and must run in order
     steps = [
         ("Checking Python version", check_python_version),
         ("Setting up virtual environment", setup_virtual_environment),
         ("Installing dependencies", install_dependencies),
-        ("Setting up pre-commit hooks", setup_pre_commit),
-        ("Verifying installation", verify_installation),
     ]
     
     for step_name, step_func in steps:
@@ -116,13 +264,17 @@ def main():
             print(f"❌ Failed: {step_name}")
             return 1
     
+    print("\n📋 Setting up pre-commit hooks and verifying installation")
+    for step, feedback in run_post_install_steps():
+        if step is setup_pre_commit:
+            print(f"❌ Failed: {feedback}")
+            return 1
+        print(f"⚠️  {feedback}, but continuing...")
+    
     print("\n🎉 Development environment setup complete!")
     print("\nNext steps:")
     print("1. Activate the virtual environment:")
-    if os.name != "nt":
-        print("   source .venv/bin/activate")
-    else:
-        print("   .venv\\Scripts\\activate.bat")
+    print(f"   {ACTIVATE_COMMAND}")
     print("2. Run tests: python -m pytest tests/")
     print("3. Run the tool: python -m bidoc --help")
     print("4. Start developing! 🎯")
@@ -1,24 +1,25 @@
+from pathlib import Path
+import re
+
 from setuptools import find_packages, setup
-import os
+
+HERE = Path(__file__).parent
 
 # Read the README file
 def read_readme():
     try:
-        with open("README.md", encoding="utf-8") as f:
-            return f.read()
+        return (HERE / "README.md").read_text(encoding="utf-8")
     except FileNotFoundError:
         return "BI Documentation Tool - Generate comprehensive documentation from Power BI and Tableau files"
 
 # Read version from __version__.py
 def read_version():
     try:
-        with open(os.path.join("bidoc", "__version__.py"), encoding="utf-8") as f:
-            for line in f:
-                if line.startswith("__version__"):
-                    return line.split("=")[1].strip().strip('"').strip("'")
+        source = (HERE / "bidoc" / "__version__.py").read_text(encoding="utf-8")
     except FileNotFoundError:
-        pass
-    return "1.0.0"
+        return "1.0.0"
+    match = re.search(r"^__version__\s*=\s*[\"']([^\"']+)[\"']", source, re.MULTILINE)
+    return match.group(1) if match else "1.0.0"
 
 setup(
     name="bidoc",
@@ -63,6 +64,7 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "pytest-mock>=3.10.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "ruff>=0.1.0",
             "mypy>=1.0.0",
@@ -78,6 +80,7 @@ setup(
         "performance": [
             "memory-profiler>=0.60.0",
             "line-profiler>=4.0.0",
+            "orjson>=3.9.0",
         ],
     },
     entry_points={
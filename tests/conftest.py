@@ -0,0 +1,270 @@
+"""Shared pytest fixtures
+
+Parser modules pull in pandas, so they are imported inside the fixtures
+that need them rather than here; this file loads on every pytest run.
+"""
+
+import contextlib
+import hashlib
+import os
+import pickle
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from unittest.mock import create_autospec
+
+import pytest
+
+from bidoc.metadata_schemas import (
+    get_default_powerbi_metadata,
+    get_default_tableau_metadata,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SAMPLES_DIR = PROJECT_ROOT / "samples"
+BIDOC_DIR = PROJECT_ROOT / "bidoc"
+POWER_BI_SAMPLE = SAMPLES_DIR / "power_bi" / "COVID-19 US Tracking Sample.pbix"
+TABLEAU_SAMPLE = SAMPLES_DIR / "Tableau" / "CH2_BBOD_CourseMetrics_v2.twbx"
+
+# Session fixtures backed by a sample file; tests using them are deselected
+# when the sample is not checked out.
+SAMPLE_FIXTURES = {
+    "parsed_powerbi_sample": POWER_BI_SAMPLE,
+    "parsed_tableau_sample": TABLEAU_SAMPLE,
+}
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Deselect tests whose sample-backed fixtures have no sample file.
+
+    Runs after the -k and -m deselection, then starts parsing the samples
+    the remaining tests use.
+    """
+    missing = {
+        name
+        for name, sample_path in SAMPLE_FIXTURES.items()
+        if not sample_path.exists()
+    }
+    deselected = [item for item in items if missing & set(item.fixturenames)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not missing & set(item.fixturenames)]
+
+    _start_sample_prefetch(config, items)
+
+
+class _FrozenList(tuple):
+    """Tuple standing in for a list inside frozen metadata."""
+
+
+def freeze_metadata(value):
+    """Return a read-only view of parsed metadata.
+
+    Dicts become MappingProxyType and lists become tuples, so a test that
+    mutates shared session data fails loudly instead of corrupting later
+    tests. Other values are returned as they are.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {key: freeze_metadata(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return _FrozenList(freeze_metadata(item) for item in value)
+    return value
+
+
+def thaw_metadata(value):
+    """Return a mutable copy of metadata frozen by freeze_metadata."""
+    if isinstance(value, MappingProxyType):
+        return {key: thaw_metadata(item) for key, item in value.items()}
+    if isinstance(value, _FrozenList):
+        return [thaw_metadata(item) for item in value]
+    return value
+
+
+def _parse_or_default(parser_factory, sample_path, default_factory):
+    """Parse a sample file, falling back to default metadata if it is missing.
+
+    The parsers already turn parse failures into default metadata; anything
+    else they raise is a regression and propagates. A parser whose optional
+    dependency is not installed skips the requesting tests.
+    """
+    if not sample_path.exists():
+        return default_factory()
+    try:
+        parser = parser_factory()
+    except ImportError as e:
+        pytest.skip(f"Parser unavailable: {e}")
+    return parser.parse(sample_path)
+
+
+def _sample_cache_key(sample_path):
+    """Key a parsed sample on the sample's bytes and the bidoc sources."""
+    digest = hashlib.sha256(sample_path.read_bytes())
+    for source in sorted(BIDOC_DIR.rglob("*.py")):
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _cached_parse(config, parser_factory, sample_path, default_factory):
+    """Parse a sample file, reusing the result pickled by an earlier run.
+
+    Results live in pytest's cache directory and are invalidated whenever the
+    sample file or any bidoc module changes. The directory is shared by
+    pytest-xdist workers, so results are published with an atomic rename and
+    a worker never reads another's partial write.
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None or not sample_path.exists():
+        return _parse_or_default(parser_factory, sample_path, default_factory)
+
+    cache_dir = cache.mkdir("bidoc-parsed-samples")
+    cache_key = _sample_cache_key(sample_path)
+    cache_file = cache_dir / f"{sample_path.stem}-{cache_key}.pickle"
+    if cache_file.exists():
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass
+
+    metadata = _parse_or_default(parser_factory, sample_path, default_factory)
+    for stale in cache_dir.glob(f"{sample_path.stem}-*.pickle"):
+        if stale != cache_file:
+            # Another worker may have removed it or still hold it open
+            with contextlib.suppress(OSError):
+                stale.unlink()
+    partial = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    partial.write_bytes(pickle.dumps(metadata))
+    os.replace(partial, cache_file)
+    return metadata
+
+
+def _parse_powerbi_sample(config):
+    from bidoc.pbix_parser import PowerBIParser
+
+    return _cached_parse(
+        config, PowerBIParser, POWER_BI_SAMPLE, get_default_powerbi_metadata
+    )
+
+
+def _parse_tableau_sample(config):
+    from bidoc.tableau_parser import TableauParser
+
+    return _cached_parse(
+        config, TableauParser, TABLEAU_SAMPLE, get_default_tableau_metadata
+    )
+
+
+SAMPLE_PARSERS = {
+    "parsed_powerbi_sample": _parse_powerbi_sample,
+    "parsed_tableau_sample": _parse_tableau_sample,
+}
+
+_sample_futures_key = pytest.StashKey[dict]()
+
+
+def _start_sample_prefetch(config, items):
+    """Start parsing, in the background, the samples the collected tests use.
+
+    The parse overlaps with tests that run before the first one needing it.
+    Nothing is started when no selected test uses a sample fixture.
+    """
+    if config.option.collectonly:
+        return
+    used = SAMPLE_PARSERS.keys() & set().union(*(item.fixturenames for item in items))
+    if not used:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    config.stash[_sample_futures_key] = {
+        name: executor.submit(SAMPLE_PARSERS[name], config) for name in sorted(used)
+    }
+    executor.shutdown(wait=False)
+
+
+def _parsed_sample(config, name):
+    """Return a parsed sample, waiting on its prefetch if one was started."""
+    future = config.stash.get(_sample_futures_key, {}).get(name)
+    if future is None:
+        return SAMPLE_PARSERS[name](config)
+    return future.result()
+
+
+@pytest.fixture(scope="session")
+def parsed_powerbi_sample(request):
+    """Provides the sample Power BI file parsed once per session.
+
+    Shared across tests and therefore frozen; fixtures handing it to tests
+    that may mutate it should pass thaw_metadata() of it.
+    """
+    return freeze_metadata(_parsed_sample(request.config, "parsed_powerbi_sample"))
+
+
+@pytest.fixture(scope="session")
+def parsed_tableau_sample(request):
+    """Provides the sample Tableau file parsed once per session.
+
+    Shared across tests and therefore frozen; fixtures handing it to tests
+    that may mutate it should pass thaw_metadata() of it.
+    """
+    return freeze_metadata(_parsed_sample(request.config, "parsed_tableau_sample"))
+
+
+@pytest.fixture(scope="session")
+def shared_temp(tmp_path_factory):
+    """Provides a session-wide directory for read-only test artifacts.
+
+    Removed at the end of the session rather than left for pytest's
+    basetemp rotation.
+    """
+    shared = tmp_path_factory.mktemp("bidoc_shared")
+    yield shared
+    shutil.rmtree(shared, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def shared_stub_pbix(shared_temp):
+    """Provides a 2 KiB stub .pbix file written once per session.
+
+    Tests must treat the file as read-only.
+    """
+    stub = shared_temp / "report.pbix"
+    stub.write_bytes(b"x" * 2048)
+    return stub
+
+
+@pytest.fixture(scope="module")
+def _powerbi_parser_mock_template():
+    """Builds the PowerBIParser autospec once per module."""
+    from bidoc.pbix_parser import PowerBIParser
+
+    return create_autospec(PowerBIParser, instance=True)
+
+
+@pytest.fixture
+def powerbi_parser_mock(_powerbi_parser_mock_template):
+    """Provides an autospecced PowerBIParser with per-test state cleared.
+
+    The template is reset rather than copied: shallow copies of a mock share
+    their child mocks, so a side effect set in one test would leak into the
+    next.
+    """
+    _powerbi_parser_mock_template.reset_mock(return_value=True, side_effect=True)
+    return _powerbi_parser_mock_template
+
+
+@pytest.fixture(scope="module")
+def _tableau_parser_mock_template():
+    """Builds the TableauParser autospec once per module."""
+    from bidoc.tableau_parser import TableauParser
+
+    return create_autospec(TableauParser, instance=True)
+
+
+@pytest.fixture
+def tableau_parser_mock(_tableau_parser_mock_template):
+    """Provides an autospecced TableauParser with per-test state cleared."""
+    _tableau_parser_mock_template.reset_mock(return_value=True, side_effect=True)
+    return _tableau_parser_mock_template
@@ -1,9 +1,15 @@
 """Basic unit tests for the BI Documentation Tool"""
 
+import io
 import json
+import os
+import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
 
 from bidoc.ai_summary import AISummary, get_summary_strategy
 from bidoc.config import AppConfig
@@ -15,12 +21,27 @@ from bidoc.test_data import (
 )
 from bidoc.utils import FileType
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+def _fast_tmpdir():
+    """Return a RAM-backed directory for temporary files when available"""
+    if sys.platform == "linux" and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
 
 class TestJSONGenerator(unittest.TestCase):
     """Test JSON output generation"""
 
-    def setUp(self):
-        self.generator = JSONGenerator()
+    @classmethod
+    def setUpClass(cls):
+        cls.generator = JSONGenerator()
 
     def test_powerbi_json_generation(self):
         """Test JSON generation for Power BI metadata"""
@@ -50,6 +71,48 @@ class TestJSONGenerator(unittest.TestCase):
         self.assertIn("worksheets", parsed)
         self.assertIn("generation_info", parsed)
 
+    def test_generate_to_writer(self):
+        """Test streaming JSON generation to a text writer"""
+        metadata = create_sample_powerbi_metadata()
+        buffer = io.StringIO()
+        self.generator.generate_to(metadata, buffer)
+
+        parsed = json.loads(buffer.getvalue())
+        self.assertEqual(parsed["type"], "Power BI")
+        self.assertIn("generation_info", parsed)
+
+    def test_orjson_output_matches_json_fallback(self):
+        """Test that orjson-backed generation produces the same document"""
+        metadata = create_sample_tableau_metadata()
+        metadata["workbook_info"] = {
+            "row_count": np.int64(5),
+            "ratio": np.float64(2.5),
+            "missing": float("nan"),
+            "overflow": float("inf"),
+            "samples": np.array([1.5, np.nan]),
+        }
+        with patch("bidoc.json_generator.HAS_ORJSON", new=False):
+            standard = json.loads(self.generator.generate(metadata))
+        fast = json.loads(self.generator.generate(metadata))
+        buffer = io.StringIO()
+        self.generator.generate_to(metadata, buffer)
+        streamed = json.loads(buffer.getvalue())
+
+        for document in (standard, streamed, fast):
+            document.pop("generation_info")
+        self.assertEqual(standard, fast)
+        self.assertEqual(streamed, fast)
+        self.assertEqual(
+            fast["workbook_info"],
+            {
+                "row_count": 5,
+                "ratio": 2.5,
+                "missing": None,
+                "overflow": None,
+                "samples": [1.5, None],
+            },
+        )
+
     def test_json_validation(self):
         """Test JSON validation"""
         valid_json = '{"test": "value"}'
@@ -62,8 +125,9 @@ class TestJSONGenerator(unittest.TestCase):
 class TestMarkdownGenerator(unittest.TestCase):
     """Test Markdown output generation"""
 
-    def setUp(self):
-        self.generator = MarkdownGenerator()
+    @classmethod
+    def setUpClass(cls):
+        cls.generator = MarkdownGenerator()
 
     def test_powerbi_markdown_generation(self):
         """Test Markdown generation for Power BI metadata"""
@@ -125,7 +189,7 @@ class TestIntegration(unittest.TestCase):
     def test_full_workflow(self):
         """Test complete workflow from metadata to output files"""
 
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory(dir=_fast_tmpdir()) as temp_dir:
             output_dir = Path(temp_dir)
 
             # Test Power BI workflow
@@ -162,9 +226,8 @@ class TestIntegration(unittest.TestCase):
             self.assertGreater(markdown_file.stat().st_size, 0)
 
             # Verify JSON is valid
-            with open(json_file, encoding="utf-8") as f:
-                parsed_json = json.load(f)
-                self.assertEqual(parsed_json["type"], "Power BI")
+            parsed_json = _loads(json_file.read_bytes())
+            self.assertEqual(parsed_json["type"], "Power BI")
 
 
 if __name__ == "__main__":
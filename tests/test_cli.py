@@ -1,35 +1,35 @@
 """Tests for the command-line interface"""
 
-import os
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
 
-from bidoc.cli import main
+from bidoc.cli import main, run_pipeline
+from bidoc.config import AppConfig
+from tests.conftest import thaw_metadata
+
+# Use a known sample file for testing
+SAMPLE_FILE = (
+    Path(__file__).resolve().parent.parent
+    / "samples"
+    / "power_bi"
+    / "COVID-19 US Tracking Sample.pbix"
+)
+
+pytestmark = pytest.mark.skipif(
+    not SAMPLE_FILE.exists(), reason="Sample PowerBI file not available"
+)
 
 
 def test_cli_runs_successfully():
     """Test that the CLI runs without crashing on a sample file."""
     runner = CliRunner()
-    # Use a known sample file for testing
-    sample_file = Path(
-        os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "samples",
-            "power_bi",
-            "COVID-19 US Tracking Sample.pbix",
+
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            main, ["--input", str(SAMPLE_FILE), "--output", "test_output", "--verbose"]
         )
-    )
-    
-    # Skip test if sample file doesn't exist
-    if not sample_file.exists():
-        pytest.skip("Sample PowerBI file not available")
-    
-    result = runner.invoke(
-        main, ["--input", str(sample_file), "--output", "test_output", "--verbose"]
-    )
 
     # Debug output
     if result.exit_code != 0:
@@ -48,3 +48,45 @@ def test_cli_runs_successfully():
         "Processing complete" in result.output
         or "Successfully processed" in result.output
     )
+
+
+@pytest.mark.parametrize(
+    "output_format,extensions",
+    [("markdown", [".md"]), ("json", [".json"]), ("all", [".md", ".json"])],
+)
+def test_cli_output_formats(
+    parsed_powerbi_sample, monkeypatch, output_format, extensions
+):
+    """Test that each output format writes the expected files without reparsing."""
+    monkeypatch.setattr(
+        "bidoc.cli.parse_file",
+        lambda file_path, file_type: thaw_metadata(parsed_powerbi_sample),
+    )
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            main,
+            ["--input", str(SAMPLE_FILE), "--output", "out", "--format", output_format],
+        )
+        written = sorted(path.suffix for path in Path("out").iterdir())
+
+    assert result.exit_code == 0, result.output
+    assert written == sorted(extensions)
+
+
+def test_run_pipeline_counts_results(parsed_powerbi_sample, monkeypatch, tmp_path):
+    """Test the processing loop directly, without click or sys.exit."""
+    monkeypatch.setattr(
+        "bidoc.cli.parse_file",
+        lambda file_path, file_type: (
+            thaw_metadata(parsed_powerbi_sample) if file_path == SAMPLE_FILE else None
+        ),
+    )
+
+    successful, failed = run_pipeline(
+        [str(SAMPLE_FILE), "missing.pbix"], tmp_path, "json", AppConfig()
+    )
+
+    assert (successful, failed) == (1, 1)
+    assert (tmp_path / f"{SAMPLE_FILE.stem}.json").exists()
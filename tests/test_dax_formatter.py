@@ -0,0 +1,31 @@
+"""Tests for DAX expression formatting"""
+
+from bidoc.dax_formatter import DAXFormatter, format_dax_expression
+
+
+def test_format_uppercases_functions():
+    """Test that known DAX functions are uppercased."""
+    formatted = DAXFormatter().format("sum(sales[amount])")
+    assert formatted == "SUM(sales[amount])"
+
+
+def test_format_dax_expression_is_cached():
+    """Test that repeated expressions are served from the cache."""
+    format_dax_expression.cache_clear()
+    expression = "calculate(sum(sales[amount]))"
+
+    first = format_dax_expression(expression)
+    second = format_dax_expression(expression)
+
+    assert first == second == DAXFormatter().format(expression)
+    assert format_dax_expression.cache_info().hits == 1
+
+
+def test_format_batch_preserves_order_and_duplicates():
+    """Test that batch formatting matches per-expression formatting."""
+    formatter = DAXFormatter()
+    expressions = ["sum(a[b])", "if(x,1,0)", "sum(a[b])"]
+
+    assert formatter.format_batch(expressions) == [
+        formatter.format(expression) for expression in expressions
+    ]
@@ -0,0 +1,24 @@
+"""Tests for the optimized Power BI parser"""
+
+from bidoc.cache_utils import clear_all_caches
+from bidoc.optimized_pbix_parser import OptimizedPowerBIParser
+
+
+def test_cache_stats_counts_hits_and_misses(shared_stub_pbix, mocker):
+    """Test that repeated parses of a file are reported as cache hits."""
+    clear_all_caches()
+    pbix_file = shared_stub_pbix
+
+    parser = OptimizedPowerBIParser()
+    mocker.patch.object(parser, "_parse_internal", return_value={"file": "report.pbix"})
+
+    parser.parse(pbix_file)
+    parser.parse(pbix_file)
+    parser.parse(pbix_file)
+
+    stats = parser.cache_stats()
+    assert stats["requests"] == 3
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["bytes_saved"] == 2 * pbix_file.stat().st_size
+    clear_all_caches()
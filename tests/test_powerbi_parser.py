@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 
 from bidoc.pbix_parser import PowerBIParser
+from tests.conftest import thaw_metadata
 
 # Define the path to the sample Power BI file
 SAMPLE_FILE_PATH = Path(
@@ -17,25 +18,16 @@ SAMPLE_FILE_PATH = Path(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def power_bi_parser():
     """Provides an instance of the PowerBiParser for the sample file."""
     return PowerBIParser()
 
 
 @pytest.fixture
-def parsed_power_bi_data(power_bi_parser):
+def parsed_power_bi_data(parsed_powerbi_sample):
     """Provides parsed data from the sample Power BI file."""
-    if SAMPLE_FILE_PATH.exists():
-        try:
-            return power_bi_parser.parse(SAMPLE_FILE_PATH)
-        except Exception:
-            # Fall back to default metadata if parsing fails
-            from bidoc.metadata_schemas import get_default_powerbi_metadata
-            return get_default_powerbi_metadata()
-    else:
-        from bidoc.metadata_schemas import get_default_powerbi_metadata
-        return get_default_powerbi_metadata()
+    return thaw_metadata(parsed_powerbi_sample)
 
 
 def test_initialization(power_bi_parser):
@@ -3,89 +3,99 @@ from pathlib import Path
 import pytest
 
 from bidoc.tableau_parser import TableauParser
+from tests.conftest import TABLEAU_SAMPLE, thaw_metadata
 
-# Define the path to the sample Tableau file
-SAMPLE_FILE_PATH = str(
-    Path(__file__).parent.parent
-    / "samples"
-    / "Tableau"
-    / "CH2_BBOD_CourseMetrics_v2.twbx"
-)
+# The sample Tableau file, as a resolved path shared with conftest
+SAMPLE_PATH: Path = TABLEAU_SAMPLE
+_SAMPLE_EXISTS = SAMPLE_PATH.exists()
 
+# Names known to be in the sample; another sample may have none of them
+_EXPECTED_WORKSHEETS = frozenset({"Classes", "Enrollments"})
+_EXPECTED_DASHBOARDS = frozenset({"Course Metrics Dashboard"})
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def tableau_parser():
-    """Provides an instance of the TableauParser."""
-    return TableauParser()
+    """Provides an instance of the TableauParser.
+
+    Built when first requested, so a missing tableaudocumentapi skips the
+    tests that need a parser instead of failing collection.
+    """
+    try:
+        return TableauParser()
+    except ImportError as e:
+        pytest.skip(f"Parser unavailable: {e}")
 
 
 @pytest.fixture
-def parsed_tableau_data(tableau_parser):
+def parsed_tableau_data(parsed_tableau_sample):
     """Provides parsed data from the sample Tableau file."""
-    sample_path = Path(SAMPLE_FILE_PATH)
-    if sample_path.exists():
-        try:
-            return tableau_parser.parse(sample_path)
-        except Exception:
-            # Fall back to default metadata if parsing fails
-            from bidoc.metadata_schemas import get_default_tableau_metadata
-            return get_default_tableau_metadata()
-    else:
-        from bidoc.metadata_schemas import get_default_tableau_metadata
-        return get_default_tableau_metadata()
+    return thaw_metadata(parsed_tableau_sample)
+
+
+@pytest.fixture(scope="session")
+def parsed_tableau_index(parsed_tableau_sample):
+    """Provides name lookups over the frozen sample Tableau data."""
+    return {
+        "worksheet_names": frozenset(
+            w["name"] for w in parsed_tableau_sample["worksheets"]
+        ),
+        "dashboard_names": frozenset(
+            d["name"] for d in parsed_tableau_sample["dashboards"]
+        ),
+        "sources_by_caption": {
+            ds["caption"]: ds
+            for ds in parsed_tableau_sample["data_sources"]
+            if ds.get("caption")
+        },
+    }
 
 
 def test_initialization(tableau_parser):
     """Tests that the TableauParser initializes correctly."""
-    assert tableau_parser is not None
-
-
-@pytest.mark.skipif(not Path(SAMPLE_FILE_PATH).exists(), reason="Sample Tableau file not available")
-def test_data_source_extraction(parsed_tableau_data):
-    """Tests the extraction of data source information."""
-    data_sources = parsed_tableau_data["data_sources"]
-    assert isinstance(data_sources, list)
-    
-    # Only check specific content if we have real data
-    if len(data_sources) > 0:
-        # Check for a known data source (skip if not found - might be different sample)
-        students_source = next(
-            (
-                ds
-                for ds in data_sources
-                if ds.get("caption") == "Students (Course Metrics Dashboard Data)"
-            ),
-            None,
-        )
-        if students_source is not None:
-            assert students_source["connections"][0]["connection_type"] == "excel-direct"
-
-
-@pytest.mark.skipif(not Path(SAMPLE_FILE_PATH).exists(), reason="Sample Tableau file not available")
-def test_worksheet_extraction(parsed_tableau_data):
-    """Tests the extraction of worksheet information."""
-    worksheets = parsed_tableau_data["worksheets"]
-    assert isinstance(worksheets, list)
-    
-    # Only check specific content if we have real data
-    if len(worksheets) > 0:
-        # Check for known worksheets (skip if not found - might be different sample)
-        worksheet_names = [w["name"] for w in worksheets]
-        if "Classes" in worksheet_names:
-            assert "Classes" in worksheet_names
-        if "Enrollments" in worksheet_names:
-            assert "Enrollments" in worksheet_names
-
-
-@pytest.mark.skipif(not Path(SAMPLE_FILE_PATH).exists(), reason="Sample Tableau file not available")
-def test_dashboard_extraction(parsed_tableau_data):
-    """Tests the extraction of dashboard information."""
-    dashboards = parsed_tableau_data["dashboards"]
-    assert isinstance(dashboards, list)
-    
-    # Only check specific content if we have real data
-    if len(dashboards) > 0:
-        # Check for a known dashboard (skip if not found - might be different sample)
-        dashboard_names = [d["name"] for d in dashboards]
-        if "Course Metrics Dashboard" in dashboard_names:
-            assert "Course Metrics Dashboard" in dashboard_names
+    assert isinstance(tableau_parser, TableauParser)
+
+
+def _probe_data_sources(index):
+    # Check for a known data source (skip if not found - might be different sample)
+    students_source = index["sources_by_caption"].get(
+        "Students (Course Metrics Dashboard Data)"
+    )
+    if students_source is not None:
+        assert students_source["connections"][0]["connection_type"] == "excel-direct"
+
+
+def _probe_worksheets(index):
+    names = index["worksheet_names"]
+    assert all(isinstance(name, str) and name for name in names)
+    # If any known worksheet is present this is the known sample, so all must be
+    present = _EXPECTED_WORKSHEETS & names
+    assert not present or present == _EXPECTED_WORKSHEETS
+
+
+def _probe_dashboards(index):
+    names = index["dashboard_names"]
+    assert all(isinstance(name, str) and name for name in names)
+    # If any known dashboard is present this is the known sample, so all must be
+    present = _EXPECTED_DASHBOARDS & names
+    assert not present or present == _EXPECTED_DASHBOARDS
+
+
+# Top-level sections and the content probe run when each is non-empty
+EXTRACTION_PROBES = (
+    ("data_sources", _probe_data_sources),
+    ("worksheets", _probe_worksheets),
+    ("dashboards", _probe_dashboards),
+)
+
+
+@pytest.mark.skipif(not _SAMPLE_EXISTS, reason="Sample Tableau file not available")
+def test_extraction(parsed_tableau_data, parsed_tableau_index):
+    """Tests the extraction of the top-level workbook sections."""
+    for key, probe in EXTRACTION_PROBES:
+        section = parsed_tableau_data[key]
+        assert isinstance(section, list), key
+
+        # Only check specific content if we have real data
+        if len(section) > 0:
+            probe(parsed_tableau_index)
@@ -0,0 +1,39 @@
+"""Tests for Jinja2 template management"""
+
+from jinja2 import FileSystemBytecodeCache
+
+from bidoc.template_utils import TemplateManager, get_bytecode_cache
+from bidoc.test_data import create_sample_powerbi_metadata
+
+
+def test_template_manager_uses_shared_bytecode_cache():
+    """Test that template managers compile through the shared bytecode cache."""
+    manager = TemplateManager()
+
+    assert manager.env.bytecode_cache is get_bytecode_cache()
+    assert manager.env.bytecode_cache is not None
+
+
+def test_bytecode_cache_is_written_then_loaded(monkeypatch, tmp_path):
+    """Test that a second manager loads the template from the bytecode cache."""
+    cache = FileSystemBytecodeCache(str(tmp_path))
+    monkeypatch.setattr("bidoc.template_utils._bytecode_cache", cache)
+
+    loaded = []
+    load_bytecode = cache.load_bytecode
+
+    def recording_load(bucket):
+        load_bytecode(bucket)
+        loaded.append(bucket.code is not None)
+
+    monkeypatch.setattr(cache, "load_bytecode", recording_load)
+
+    metadata = create_sample_powerbi_metadata()
+    context = {"file": metadata["file"], "tables": metadata["tables"]}
+
+    first = TemplateManager().render_template("generic.md.j2", context)
+    assert list(tmp_path.glob("__jinja2_*.cache"))
+
+    second = TemplateManager().render_template("generic.md.j2", context)
+    assert loaded == [False, True]
+    assert first == second